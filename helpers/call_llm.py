@@ -258,11 +258,6 @@ async def _execute_llm_chat(
     logger.debug("Running LLM chat")
     content_full = ""
 
-    async def _buffer_callback(text: str, style: MessageStyleEnum) -> None:
-        nonlocal content_full
-        content_full += f" {text}"
-        await tts_callback(text, style)
-
     async def _content_callback(
         buffer: str, style: MessageStyleEnum
     ) -> MessageStyleEnum:
@@ -286,19 +281,32 @@ async def _execute_llm_chat(
         trainings=trainings,
     )
 
+    # Tools confirmations
+    tts_tasks: list[asyncio.Task] = []
+
+    async def _tool_tts_callback(text: str, style: MessageStyleEnum) -> None:
+        """
+        Speak a tool confirmation in the background, without blocking the tool.
+
+        Text is stored right away to keep the call order in the message, then confirmations are spoken concurrently. Tasks are owned by the chat: they are awaited before the message is stored and cancelled with the chat.
+        """
+        nonlocal content_full
+        content_full += f" {text}"
+        tts_tasks.append(asyncio.create_task(tts_callback(text, style)))
+
     # Build plugins
     plugins = LlmPlugins(
         call=call,
         client=client,
         post_callback=post_callback,
-        tts_callback=_buffer_callback,
+        tts_callback=_tool_tts_callback,
     )
 
     tools = []
     if not use_tools:
         logger.warning("Tools disabled for this chat")
     else:
-        tools = await plugins.to_openai(call)
+        tools = plugins.to_openai(call)
         logger.debug("Tools: %s", tools)
 
     # Execute LLM inference
@@ -377,7 +385,16 @@ async def _execute_llm_chat(
 
     # Execute tools
     tool_tasks = [tool_call.execute_function(plugins) for tool_call in tool_calls]
-    await asyncio.gather(*tool_tasks)
+    try:
+        await asyncio.gather(*tool_tasks)
+    except asyncio.CancelledError:  # Chat cancelled, stop speaking confirmations
+        for task in tts_tasks:
+            task.cancel()
+        raise
+    finally:  # Confirmations are part of the message content
+        for res in await asyncio.gather(*tts_tasks, return_exceptions=True):
+            if isinstance(res, Exception):
+                logger.warning("Error while speaking tool confirmation: %s", res)
     call = plugins.call  # Update call model if object reference changed
 
     # Store message
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cached_property
 from typing import Annotated, Any, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, create_model
@@ -70,6 +71,10 @@ class LanguageModel(BaseModel):
             self.availables[0],
         )
 
+    @cached_property
+    def available_short_codes(self) -> frozenset[str]:
+        return frozenset(lang.short_code for lang in self.availables)
+
 
 class WorkflowInitiateModel(BaseModel):
     agent_phone_number: PhoneNumber
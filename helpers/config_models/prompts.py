@@ -10,6 +10,7 @@ from azure.core.exceptions import HttpResponseError
 from openai.types.chat import ChatCompletionSystemMessageParam
 from pydantic import BaseModel, TypeAdapter
 
+from helpers.lru import LruCache
 from models.call import CallStateModel
 from models.message import MessageModel
 from models.next import NextModel
@@ -17,6 +18,23 @@ from models.reminder import ReminderModel
 from models.synthesis import SynthesisModel
 from models.training import TrainingModel
 
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_GOODBYES_MAX_SIZE = 32
+
 
 class SoundModel(BaseModel):
     loading_tpl: str = "{public_url}/loading.wav"
@@ -327,8 +345,8 @@ class LlmModel(BaseModel):
                 bot_company=call.initiate.bot_company,
                 bot_name=call.initiate.bot_name,
                 bot_phone_number=CONFIG.communication_services.phone_number,
-                date=datetime.now(call.tz()).strftime(
-                    "%a %d %b %Y, %H:%M (%Z)"
+                date=_format_date(
+                    datetime.now(call.tz())
                 ),  # Don't include secs to enhance cache during unit tests. Example: "Mon 15 Jul 2024, 12:43 (CEST)"
                 phone_number=call.initiate.phone_number,
             )
@@ -533,11 +551,28 @@ class TtsModel(BaseModel):
         return await self._translate(self.error_tpl, call)
 
     async def goodbye(self, call: CallStateModel) -> str:
-        return await self._translate(
+        """
+        Get the goodbye prompt, played on each hangup.
+
+        Successful translations are memoized in a LRU, by company and language. Failed ones are retried on the next call.
+        """
+        # Try memory
+        memory_key = (call.initiate.bot_company, call.lang.short_code)
+        cached = self._goodbyes.get(memory_key)
+        if cached is not None:
+            return cached
+
+        initial = self._return(
             self.goodbye_tpl,
-            call,
             bot_company=call.initiate.bot_company,
         )
+        translation = await self._translate_text(initial, call)
+
+        # Update memory
+        if translation:
+            self._goodbyes.set(memory_key, translation)
+
+        return translation or initial
 
     async def hello(self, call: CallStateModel) -> str:
         return await self._translate(
@@ -589,20 +624,29 @@ class TtsModel(BaseModel):
 
         If the translation fails, the initial prompt is returned.
         """
+        initial = self._return(prompt_tpl, **kwargs)
+        translation = await self._translate_text(initial, call)
+        return translation or initial
+
+    async def _translate_text(self, text: str, call: CallStateModel) -> Optional[str]:
+        """
+        Translate the text to the call language.
+
+        If the translation fails, `None` is returned.
+        """
         from helpers.translation import (  # pylint: disable=import-outside-toplevel
             translate_text,
         )
 
-        initial = self._return(prompt_tpl, **kwargs)
-        translation = None
         try:
-            translation = await translate_text(
-                initial, self.tts_lang, call.lang.short_code
-            )
+            return await translate_text(text, self.tts_lang, call.lang.short_code)
         except HttpResponseError as e:
             self.logger.warning("Failed to translate TTS prompt: %s", e)
-            pass
-        return translation or initial
+        return None
+
+    @cached_property
+    def _goodbyes(self) -> LruCache[tuple[str, str], str]:
+        return LruCache(max_size=_GOODBYES_MAX_SIZE)
 
     @cached_property
     def logger(self) -> Logger:
@@ -615,3 +659,12 @@ class PromptsModel(BaseModel):
     llm: LlmModel = LlmModel()  # Object is fully defined by default
     sounds: SoundModel = SoundModel()  # Object is fully defined by default
     tts: TtsModel = TtsModel()  # Object is fully defined by default
+
+
+def _format_date(date: datetime) -> str:
+    """
+    Format a date like `strftime("%a %d %b %Y, %H:%M (%Z)")` and return it.
+
+    Names are always in English, whatever the system locale, and the locale-aware `strftime` machinery is skipped.
+    """
+    return f"{_WEEKDAYS[date.weekday()]} {date.day:02d} {_MONTHS[date.month - 1]} {date.year}, {date.hour:02d}:{date.minute:02d} ({date.tzname() or ''})"
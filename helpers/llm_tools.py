@@ -1,6 +1,6 @@
 import asyncio
 from html import escape
-from inspect import getmembers, isfunction
+from inspect import isfunction
 from typing import Annotated, Awaitable, Callable, Literal
 
 from azure.communication.callautomation.aio import CallAutomationClient
@@ -12,6 +12,7 @@ from helpers.call_utils import ContextEnum as CallContextEnum, handle_play_text
 from helpers.config import CONFIG
 from helpers.llm_utils import function_schema
 from helpers.logging import logger
+from helpers.lru import LruCache
 from models.call import CallStateModel
 from models.message import (
     ActionEnum as MessageActionEnum,
@@ -24,6 +25,7 @@ from models.training import TrainingModel
 
 _search = CONFIG.ai_search.instance()
 _sms = CONFIG.sms.instance()
+_SCHEMA_CACHE_MAX_SIZE = 100
 
 
 class UpdateClaimDict(TypedDict):
@@ -32,10 +34,12 @@ class UpdateClaimDict(TypedDict):
 
 
 class LlmPlugins:
+    __slots__ = ("call", "client", "post_callback", "style", "tts_callback")
+
     call: CallStateModel
     client: CallAutomationClient
     post_callback: Callable[[CallStateModel], Awaitable[None]]
-    style: MessageStyleEnum = MessageStyleEnum.NONE
+    style: MessageStyleEnum
     tts_callback: Callable[[str, MessageStyleEnum], Awaitable[None]]
 
     def __init__(
@@ -48,6 +52,7 @@ class LlmPlugins:
         self.call = call
         self.client = client
         self.post_callback = post_callback
+        self.style = MessageStyleEnum.NONE
         self.tts_callback = tts_callback
 
     async def end_call(self) -> str:
@@ -468,7 +473,7 @@ class LlmPlugins:
         if not success:
             return "Failed to send SMS"
         self.call.messages.append(
-            MessageModel(
+            MessageModel.model_construct(  # Skip validation, values are trusted
                 action=MessageActionEnum.SMS,
                 content=message,
                 persona=MessagePersonaEnum.ASSISTANT,
@@ -511,6 +516,9 @@ class LlmPlugins:
         """
         # Clamp speed between min and max
         speed = max(0.75, min(speed, 1.25))
+        # Skip if unchanged, to avoid a TTS round-trip
+        if abs(speed - self.call.initiate.prosody_rate) < 1e-3:
+            return f"Voice speed already set to {speed}"
         # Update voice
         initial_speed = self.call.initiate.prosody_rate
         self.call.initiate.prosody_rate = speed
@@ -568,10 +576,8 @@ class LlmPlugins:
         - Customer made a mistake in the language selection
         - Trouble understanding the voice in the current language
         """
-        if not any(
-            lang == available.short_code
-            for available in self.call.initiate.lang.availables
-        ):  # Check if lang is available
+        # Check if lang is available
+        if lang not in self.call.initiate.lang.available_short_codes:
             return f"Language {lang} not available"
 
         # Update lang
@@ -583,11 +589,47 @@ class LlmPlugins:
         return f"Voice language set to {lang} (was {initial_lang})"
 
     @staticmethod
-    async def to_openai(call: CallStateModel) -> list[ChatCompletionToolParam]:
-        return await asyncio.gather(
-            *[
-                function_schema(type, call=call)
-                for name, type in getmembers(LlmPlugins, isfunction)
-                if not name.startswith("_") and name != "to_openai"
-            ]
-        )
+    def function_names() -> list[str]:
+        """
+        Get the names of the plugins exposed to the LLM.
+        """
+        return [func.__name__ for func in _PLUGIN_METHODS]
+
+    @staticmethod
+    def to_openai(call: CallStateModel) -> list[ChatCompletionToolParam]:
+        """
+        Get the OpenAI tools definition for all plugins.
+
+        Schemas only depend on the call parts templated into the descriptions, so they are built once per variant and reused across turns. Schemas are shared across calls, callers must not mutate them.
+        """
+        key = _schema_cache_key(call)
+        cached = _SCHEMA_CACHE.get(key)
+        if cached is not None:
+            return list(cached)
+        res = [function_schema(func, call=call) for func in _PLUGIN_METHODS]
+        _SCHEMA_CACHE.set(key, res)
+        return list(res)
+
+
+def _schema_cache_key(call: CallStateModel) -> tuple:
+    """
+    Build a cache key from everything templated into the plugins descriptions.
+    """
+    initiate = call.initiate
+    return (
+        tuple(
+            (lang.short_code, tuple(lang.pronunciations_en))
+            for lang in initiate.lang.availables
+        ),
+        tuple((field.name, field.type, field.description) for field in initiate.claim),
+    )
+
+
+_PLUGIN_METHODS = tuple(
+    func
+    for name, func in sorted(vars(LlmPlugins).items())
+    if isfunction(func) and not name.startswith("_")
+)  # Sorted by name, tools order must be stable to hit the LLM prompt cache
+_SCHEMA_CACHE: LruCache[tuple, list[ChatCompletionToolParam]] = LruCache(
+    max_size=_SCHEMA_CACHE_MAX_SIZE
+)  # Claim and languages can be customized per call from the API
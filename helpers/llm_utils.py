@@ -4,13 +4,14 @@ See: https://github.com/microsoft/autogen/blob/2750391f847b7168d842dfcb815ac37bd
 """
 
 import inspect
+from functools import lru_cache
 from textwrap import dedent
 from typing import Any, Callable, ForwardRef, Tuple, TypeVar, Union
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 from openai.types.chat import ChatCompletionToolParam
 from openai.types.shared_params.function_definition import FunctionDefinition
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
 from pydantic._internal._typing_extra import eval_type_lenient
 from pydantic.json_schema import JsonSchemaValue
 from typing_extensions import Annotated
@@ -20,8 +21,7 @@ from helpers.logging import logger
 T = TypeVar("T")
 _jinja = Environment(
     autoescape=True,
-    enable_async=True,
-)
+)  # Sync rendering, templates are CPU-only
 
 
 class Parameters(BaseModel):
@@ -34,14 +34,57 @@ class Parameters(BaseModel):
     type: str = "object"
 
 
-async def function_schema(
-    f: Callable[..., Any], **kwargs: Any
-) -> ChatCompletionToolParam:
+def function_schema(f: Callable[..., Any], **kwargs: Any) -> ChatCompletionToolParam:
     """
     Take a function and return a JSON schema for it as defined by the OpenAI API.
 
     Kwargs are passed to the Jinja template for rendering the function description and parameter descriptions.
 
+    Raise TypeError if the function is not annotated.
+    """
+    description_tpl, parameters_tpl, required_params = _function_template(f)
+
+    description = _remove_newlines(
+        description_tpl.render(**kwargs)
+    )  # Render the description, then remove newlines to avoid hallucinations
+    name = f.__name__
+    parameters: dict[str, object] = Parameters(
+        properties={
+            param_name: {
+                **schema,
+                "description": _remove_newlines(param_tpl.render(**kwargs)),
+            }
+            for param_name, (schema, param_tpl) in parameters_tpl.items()
+        },
+        required=required_params,
+    ).model_dump()
+
+    function = ChatCompletionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            description=description,
+            name=name,
+            parameters=parameters,
+        ),
+    )
+
+    return function
+
+
+@lru_cache
+def _function_template(
+    f: Callable[..., Any]
+) -> tuple[Template, dict[str, tuple[JsonSchemaValue, Template]], list[str]]:
+    """
+    Get the static parts of a function schema and return them with the compiled description templates.
+
+    Signature introspection, JSON schema generation and Jinja compilation do not depend on the rendering context, so they are done once per function.
+
+    Returns a tuple:
+    1. Description template
+    2. Parameters JSON schema and description template, by name
+    3. Required parameters
+
     Raise TypeError if the function is not annotated.
     """
     typed_signature = _typed_signature(f)
@@ -69,29 +112,58 @@ async def function_schema(
             + f"The annotations are missing for the following parameters: {', '.join(missing_s)}"
         )
 
-    description = _remove_newlines(
-        await _jinja.from_string(dedent(f.__doc__ or "")).render_async(**kwargs)
-    )  # Remove possible indentation, render the description, then remove newlines to avoid hallucinations
-    name = f.__name__
-    parameters: dict[str, object] = (
-        await _parameters(
+    description_tpl = _jinja.from_string(
+        dedent(f.__doc__ or "")
+    )  # Remove possible indentation
+    parameters_tpl = {
+        name: _parameter_template(
             default_values=default_values,
-            param_annotations=param_annotations,
-            required_params=required_params,
-            **kwargs,
+            name=name,
+            value=value,
         )
-    ).model_dump()
+        for name, value in param_annotations.items()
+        if value != inspect.Signature.empty and name != "self"
+    }
 
-    function = ChatCompletionToolParam(
-        type="function",
-        function=FunctionDefinition(
-            description=description,
-            name=name,
-            parameters=parameters,
-        ),
+    return (
+        description_tpl,
+        parameters_tpl,
+        sorted(required_params),  # Stable order, so the tools prompt prefix is byte-identical across processes and hits the LLM prompt cache
     )
 
-    return function
+
+def validate_arguments(f: Callable[..., Any], args: dict[str, Any]) -> dict[str, Any]:
+    """
+    Validate the arguments of a function against its signature and return them, coerced to the annotated types.
+
+    Allows to reject LLM hallucinated arguments before the function is executed.
+
+    Raise ValidationError if the arguments are invalid.
+    """
+    model = _arguments_model(f).model_validate(args)
+    return dict(model)
+
+
+@lru_cache
+def _arguments_model(f: Callable[..., Any]) -> type[BaseModel]:
+    """
+    Get a Pydantic model of the parameters of a function and return it.
+
+    Model is compiled once per function, as it only depends on the signature.
+    """
+    typed_signature = _typed_signature(f)
+    default_values = _default_values(typed_signature)
+    field_definitions = {
+        name: (value, default_values.get(name, ...))
+        for name, value in _param_annotations(typed_signature).items()
+    }
+    return create_model(
+        f"{f.__name__}Arguments",
+        **field_definitions,  # pyright: ignore
+        __config__=ConfigDict(
+            extra="forbid",  # Unknown arguments are hallucinations
+        ),
+    )
 
 
 def _typed_annotation(annotation: Any, global_namespace: dict[str, Any]) -> Any:
@@ -136,16 +208,13 @@ def _param_annotations(
     }
 
 
-async def _parameter_json_schema(
+def _parameter_template(
     name: str,
     value: Union[Annotated[type[Any], str], type[Any]],
     default_values: dict[str, Any],
-    **kwargs: Any,
-) -> JsonSchemaValue:
+) -> tuple[JsonSchemaValue, Template]:
     """
-    Get a JSON schema for a parameter as defined by the OpenAI API and return the Pydantic model for the parameter.
-
-    Kwargs are passed to the Jinja template for rendering the parameter description.
+    Get a JSON schema for a parameter as defined by the OpenAI API and return it with the compiled description template.
     """
 
     def _description(
@@ -166,13 +235,11 @@ async def _parameter_json_schema(
         dv = default_values[name]
         schema["default"] = dv
 
-    schema["description"] = _remove_newlines(
-        await _jinja.from_string(dedent(_description(name, value))).render_async(
-            **kwargs
-        )
-    )  # Remove possible indentation, render the description, then remove newlines to avoid hallucinations
+    description_tpl = _jinja.from_string(
+        dedent(_description(name, value))
+    )  # Remove possible indentation
 
-    return schema
+    return schema, description_tpl
 
 
 def _required_params(typed_signature: inspect.Signature) -> set[str]:
@@ -197,32 +264,6 @@ def _default_values(typed_signature: inspect.Signature) -> dict[str, Any]:
     }
 
 
-async def _parameters(
-    required_params: set[str],
-    param_annotations: dict[str, Union[Annotated[type[Any], str], type[Any]]],
-    default_values: dict[str, Any],
-    **kwargs: Any,
-) -> Parameters:
-    """
-    Get the parameters of a function as defined by the OpenAI API and return the Pydantic model for the parameters.
-
-    Kwargs are passed to the Jinja template for rendering the parameter description.
-    """
-    return Parameters(
-        properties={
-            name: await _parameter_json_schema(
-                default_values=default_values,
-                name=name,
-                value=value,
-                **kwargs,
-            )
-            for name, value in param_annotations.items()
-            if value != inspect.Signature.empty and name != "self"
-        },
-        required=list(required_params),
-    )
-
-
 def _missing_annotations(
     typed_signature: inspect.Signature, required_params: set[str]
 ) -> tuple[set[str], set[str]]:
@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LruCache(Generic[K, V]):
+    """
+    A simple in-memory cache, for values computed by the process.
+
+    Use the least recently used (LRU) policy to remove the oldest used items when the cache is full.
+
+    See: https://en.wikipedia.org/wiki/Cache_replacement_policies#Least_recently_used_(LRU)
+    """
+
+    __slots__ = ("_cache", "_max_size")
+
+    _cache: OrderedDict[K, V]
+    _max_size: int
+
+    def __init__(self, max_size: int):
+        self._cache = OrderedDict()
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a value from the cache.
+
+        If the key does not exist, return `None`.
+        """
+        res = self._cache.get(key, None)
+        if res is None:
+            return None
+        self._cache.move_to_end(key, last=False)  # Move to first
+        return res
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Set a value in the cache.
+
+        An existing key is replaced in place, so concurrent misses on the same key do not evict other items.
+        """
+        if key not in self._cache and len(self._cache) >= self._max_size:
+            self._cache.popitem()  # Delete the last
+        # Add to first
+        self._cache[key] = value
+        self._cache.move_to_end(key, last=False)
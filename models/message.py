@@ -2,7 +2,7 @@ import json
 import re
 from datetime import UTC, datetime
 from enum import Enum
-from inspect import getmembers, isfunction
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 from json_repair import repair_json
@@ -13,7 +13,7 @@ from openai.types.chat import (
     ChatCompletionUserMessageParam,
 )
 from openai.types.chat.chat_completion_chunk import ChoiceDeltaToolCall
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from helpers.monitoring import tracer
 
@@ -82,6 +82,9 @@ class ToolModel(BaseModel):
         return self
 
     async def execute_function(self, plugins: object) -> None:
+        from helpers.llm_utils import (  # pylint: disable=import-outside-toplevel
+            validate_arguments,
+        )
         from helpers.logging import logger  # pylint: disable=import-outside-toplevel
 
         json_str = self.function_arguments
@@ -118,6 +121,21 @@ class ToolModel(BaseModel):
                 "name": name,
             },
         ) as span:
+            # Validate args before execution, to avoid side effects with wrong args
+            try:
+                args = validate_arguments(getattr(type(plugins), name), args)
+            except ValidationError as e:
+                logger.warning(
+                    "Invalid arguments for function %s: %s. Error: %s",
+                    name,
+                    args,
+                    e,
+                )
+                res = f"Wrong arguments, please fix them and try again: {e.json()}"
+                span.set_attribute("result", res)
+                self.content = res
+                return
+
             try:
                 res = await getattr(plugins, name)(**args)
                 res_log = f"{res[:20]}...{res[-20:]}"
@@ -144,12 +162,13 @@ class ToolModel(BaseModel):
             self.content = res
 
     @staticmethod
+    @lru_cache
     def _available_function_names() -> list[str]:
         from helpers.llm_tools import (  # pylint: disable=import-outside-toplevel
             LlmPlugins,
         )
 
-        return [name for name, _ in getmembers(LlmPlugins, isfunction)]
+        return LlmPlugins.function_names()
 
 
 class MessageModel(BaseModel):
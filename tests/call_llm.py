@@ -0,0 +1,198 @@
+import asyncio
+import json
+import logging
+
+import pytest
+from openai.types.chat.chat_completion_chunk import (
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+from pytest import assume  # pylint: disable=no-name-in-module # pyright: ignore
+
+from helpers import call_llm
+from helpers.call_llm import _execute_llm_chat
+from models.call import CallStateModel
+from models.message import (
+    MessageModel,
+    PersonaEnum as MessagePersonaEnum,
+    StyleEnum as MessageStyleEnum,
+)
+from tests.conftest import CallAutomationClientMock
+
+
+def _mock_llm(
+    monkeypatch: pytest.MonkeyPatch, call: CallStateModel, confirmations: list[str]
+) -> None:
+    """
+    Mock the LLM to call one tool per confirmation, in the given order.
+    """
+
+    async def _completion_stream(*args, **kwargs):
+        for i, confirmation in enumerate(confirmations):
+            yield ChoiceDelta(
+                tool_calls=[
+                    ChoiceDeltaToolCall(
+                        function=ChoiceDeltaToolCallFunction(
+                            arguments=json.dumps(
+                                {
+                                    "customer_response": confirmation,
+                                    "updates": [],
+                                }
+                            ),
+                            name="updated_claim",
+                        ),
+                        id=f"tool-{i}",
+                        index=i,
+                        type="function",
+                    )
+                ]
+            )
+
+    async def _trainings(*args, **kwargs) -> list:
+        return []
+
+    monkeypatch.setattr(call_llm, "completion_stream", _completion_stream)
+    monkeypatch.setattr(CallStateModel, "trainings", _trainings)
+    call.messages.append(
+        MessageModel(
+            content="Hello, I want to update my claim.",
+            persona=MessagePersonaEnum.HUMAN,
+        )
+    )
+
+
+async def _post_callback(_: CallStateModel) -> None:
+    pass
+
+
+def _client() -> CallAutomationClientMock:
+    return CallAutomationClientMock(
+        hang_up_callback=lambda: None,
+        play_media_callback=lambda _: None,
+        transfer_callback=lambda: None,
+    )
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_tool_confirmations_order(
+    call: CallStateModel, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test tool confirmations are spoken concurrently and stored in call order.
+
+    Steps:
+    1. Mock the LLM with two tools, the first confirmation being the slowest to speak
+    2. Check the second confirmation is spoken first
+    3. Check the message content keeps the call order
+    """
+    _mock_llm(monkeypatch, call, ["First.", "Second."])
+    spoken: list[str] = []
+
+    async def _tts_callback(text: str, _: MessageStyleEnum) -> None:
+        await asyncio.sleep(0.2 if text == "First." else 0)
+        spoken.append(text)
+
+    is_error, _, call = await _execute_llm_chat(
+        call=call,
+        client=_client(),
+        post_callback=_post_callback,
+        tts_callback=_tts_callback,
+        use_tools=True,
+    )
+
+    assume(not is_error)
+    assume(spoken == ["Second.", "First."])  # Concurrent, fastest first
+    assume(call.messages[-1].persona == MessagePersonaEnum.ASSISTANT)
+    assume(call.messages[-1].content == "First. Second.")  # Call order
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_tool_confirmations_error(
+    call: CallStateModel,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test a failing tool confirmation is logged, not raised.
+
+    Steps:
+    1. Mock the LLM with two tools, the first confirmation failing
+    2. Check the chat succeeds and the other confirmation is spoken
+    3. Check the error is logged
+    """
+    _mock_llm(monkeypatch, call, ["First.", "Second."])
+    spoken: list[str] = []
+
+    async def _tts_callback(text: str, _: MessageStyleEnum) -> None:
+        if text == "First.":
+            raise RuntimeError("TTS failure")
+        spoken.append(text)
+
+    with caplog.at_level(logging.WARNING, logger="call-center-ai"):
+        is_error, _, call = await _execute_llm_chat(
+            call=call,
+            client=_client(),
+            post_callback=_post_callback,
+            tts_callback=_tts_callback,
+            use_tools=True,
+        )
+
+    assume(not is_error)
+    assume(spoken == ["Second."])
+    assume(call.messages[-1].content == "First. Second.")
+    assume(
+        any(
+            "Error while speaking tool confirmation" in record.getMessage()
+            and "TTS failure" in record.getMessage()
+            for record in caplog.records
+        )
+    )
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_tool_confirmations_cancel(
+    call: CallStateModel, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test cancelling the chat cancels the pending tool confirmations.
+
+    Steps:
+    1. Mock the LLM with two tools, confirmations never ending
+    2. Cancel the chat once both confirmations are speaking
+    3. Check both confirmations are cancelled
+    """
+    _mock_llm(monkeypatch, call, ["First.", "Second."])
+    started: list[str] = []
+    cancelled: list[str] = []
+
+    async def _tts_callback(text: str, _: MessageStyleEnum) -> None:
+        started.append(text)
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(text)
+            raise
+
+    chat_task = asyncio.create_task(
+        _execute_llm_chat(
+            call=call,
+            client=_client(),
+            post_callback=_post_callback,
+            tts_callback=_tts_callback,
+            use_tools=True,
+        )
+    )
+
+    # Wait for both confirmations to start
+    for _ in range(100):
+        if len(started) == 2:
+            break
+        await asyncio.sleep(0.05)
+    assume(sorted(started) == ["First.", "Second."])
+
+    chat_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await chat_task
+
+    assume(sorted(cancelled) == ["First.", "Second."])
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+
+from typing import Optional
+
+import pytest
+from azure.core.exceptions import HttpResponseError
+from pytest import assume  # pylint: disable=no-name-in-module # pyright: ignore
+from pytz import timezone, utc
+
+from helpers import translation
+from helpers.config_models.conversation import LanguageEntryModel, LanguageModel
+from helpers.config_models.prompts import TtsModel, _format_date
+from models.call import CallStateModel
+
+
+def test_available_short_codes() -> None:
+    """
+    Test the available short codes match the available languages.
+
+    Steps:
+    1. Create a language model with custom languages
+    2. Check all languages are available
+    3. Check an unknown language is not available
+    """
+    lang = LanguageModel(
+        availables=[
+            LanguageEntryModel(
+                pronunciations_en=["German", "DE", "Germany"],
+                short_code="de-DE",
+                voice="de-DE-KatjaNeural",
+            ),
+            LanguageEntryModel(
+                pronunciations_en=["Italian", "IT", "Italy"],
+                short_code="it-IT",
+                voice="it-IT-ElsaNeural",
+            ),
+        ],
+        default_short_code="de-DE",
+    )
+
+    assume(lang.available_short_codes == frozenset({"de-DE", "it-IT"}))
+    assume("de-DE" in lang.available_short_codes)
+    assume("it-IT" in lang.available_short_codes)
+    assume("fr-FR" not in lang.available_short_codes)
+    assume("de" not in lang.available_short_codes)  # Full short code is required
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        pytest.param(
+            timezone("Europe/Paris").localize(datetime(2024, 7, 15, 12, 43, 59)),
+            id="summer_time",
+        ),
+        pytest.param(
+            timezone("America/New_York").localize(datetime(2024, 1, 1, 0, 0)),
+            id="padding",
+        ),
+        pytest.param(
+            datetime(2023, 12, 31, 23, 59, tzinfo=utc),
+            id="utc",
+        ),
+        pytest.param(
+            datetime(2024, 2, 29, 9, 5),
+            id="naive",
+        ),
+    ],
+)
+def test_format_date(date: datetime) -> None:
+    """
+    Test the date format is the same as `strftime`.
+
+    Covers zero-padding, timezone names, and naive dates without a timezone name.
+    """
+    assume(_format_date(date) == date.strftime("%a %d %b %Y, %H:%M (%Z)"))
+
+
+def test_format_date_names() -> None:
+    """
+    Test all the weekday and month names are the same as `strftime`.
+    """
+    for day in range(365):
+        date = datetime(2024, 1, 1) + timedelta(days=day)
+        assume(_format_date(date) == date.strftime("%a %d %b %Y, %H:%M (%Z)"))
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_goodbye_memory(
+    call: CallStateModel, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test the goodbye translation is memoized by company and language, and only when successful.
+
+    Steps:
+    1. Mock the translation to fail, then to raise
+    2. Check the initial prompt is returned and the translation is retried
+    3. Mock the translation to succeed
+    4. Check the translation is memoized
+    5. Change the language, then the company
+    6. Check each is translated again
+    """
+    translated: list[tuple[str, str]] = []
+    outcome = "none"
+
+    async def _translate_text(
+        text: str, source_lang: str, target_lang: str
+    ) -> Optional[str]:
+        translated.append((text, target_lang))
+        if outcome == "none":
+            return None
+        if outcome == "error":
+            raise HttpResponseError("Translation failure")
+        return f"[{target_lang}] {text}"
+
+    monkeypatch.setattr(translation, "translate_text", _translate_text)
+    tts = TtsModel()
+    call.lang = "fr-FR"
+    company = call.initiate.bot_company
+    initial = tts.goodbye_tpl.format(bot_company=company)
+
+    # Failed translations are not stored
+    assume(await tts.goodbye(call) == initial)
+    outcome = "error"
+    assume(await tts.goodbye(call) == initial)
+    assume(len(translated) == 2)
+
+    # Successful translation is stored
+    outcome = "success"
+    assume(await tts.goodbye(call) == f"[fr-FR] {initial}")
+    assume(await tts.goodbye(call) == f"[fr-FR] {initial}")
+    assume(len(translated) == 3)
+
+    # Keyed by language
+    call.lang = "es-ES"
+    assume(await tts.goodbye(call) == f"[es-ES] {initial}")
+    assume(len(translated) == 4)
+
+    # Keyed by company
+    call.initiate.bot_company = "Other Company"
+    other_initial = tts.goodbye_tpl.format(bot_company="Other Company")
+    assume(await tts.goodbye(call) == f"[es-ES] {other_initial}")
+    assume(len(translated) == 5)
+
+    # Previous entries are still stored
+    call.lang = "fr-FR"
+    call.initiate.bot_company = company
+    assume(await tts.goodbye(call) == f"[fr-FR] {initial}")
+    assume(len(translated) == 5)
@@ -0,0 +1,181 @@
+import pytest
+from pytest import assume  # pylint: disable=no-name-in-module # pyright: ignore
+
+from helpers.config_models.conversation import LanguageEntryModel
+from helpers.llm_tools import LlmPlugins, _PLUGIN_METHODS, _schema_cache_key
+from helpers.llm_utils import function_schema
+from models.call import CallStateModel
+from models.claim import ClaimFieldModel, ClaimTypeEnum
+from models.message import StyleEnum as MessageStyleEnum
+from tests.conftest import CallAutomationClientMock
+
+
+def test_schema_cache_key(call: CallStateModel) -> None:
+    """
+    Test the tools schema cache key only depends on the templated call parts.
+
+    Steps:
+    1. Build a copy of the call with different per-call values
+    2. Check the key is the same
+    3. Customize the claim, then the languages
+    4. Check the key changes each time
+    """
+    initial_key = _schema_cache_key(call)
+
+    # Per-call values are not templated
+    same = call.model_copy(deep=True)
+    same.lang_short_code = "en-US"
+    same.voice_id = "other"
+    assume(_schema_cache_key(same) == initial_key)
+
+    # Claim is templated
+    custom_claim = call.model_copy(deep=True)
+    custom_claim.initiate.claim.append(
+        ClaimFieldModel(
+            description="Car brand",
+            name="car_brand",
+            type=ClaimTypeEnum.TEXT,
+        )
+    )
+    claim_key = _schema_cache_key(custom_claim)
+    assume(claim_key != initial_key)
+
+    # Languages are templated
+    custom_lang = call.model_copy(deep=True)
+    custom_lang.initiate.lang.availables.append(
+        LanguageEntryModel(
+            pronunciations_en=["German", "DE", "Germany"],
+            short_code="de-DE",
+            voice="de-DE-KatjaNeural",
+        )
+    )
+    lang_key = _schema_cache_key(custom_lang)
+    assume(lang_key != initial_key)
+    assume(lang_key != claim_key)
+
+    # Keys are hashable, to be stored in the cache
+    assume(len({initial_key, claim_key, lang_key}) == 3)
+
+
+def _speech_lang_description(call: CallStateModel) -> str:
+    """
+    Get the rendered description of the `speech_lang` language parameter.
+    """
+    tool = next(
+        tool
+        for tool in LlmPlugins.to_openai(call)
+        if tool["function"]["name"] == "speech_lang"
+    )
+    return tool["function"]["parameters"]["properties"]["lang"]["description"]  # pyright: ignore
+
+
+def test_to_openai_cache(call: CallStateModel) -> None:
+    """
+    Test the cached tools schemas are the same as the rendered ones.
+
+    Steps:
+    1. Get the tools schemas twice
+    2. Check they are the same as rendering each plugin
+    3. Check the second call is served from the cache
+    """
+    first = LlmPlugins.to_openai(call)
+    second = LlmPlugins.to_openai(call)
+
+    assume(first == [function_schema(func, call=call) for func in _PLUGIN_METHODS])
+    assume(second == first)
+    assume(all(a is b for a, b in zip(first, second)))  # Same schemas, from cache
+
+
+def test_to_openai_cache_lang(call: CallStateModel) -> None:
+    """
+    Test a new language is rendered in the tools schemas, not served from the cache.
+
+    Steps:
+    1. Get the language description
+    2. Add a language, one without pronunciation
+    3. Check the descriptions are updated each time
+    """
+    initial_description = _speech_lang_description(call)
+    assume("de-DE" not in initial_description)
+
+    # New language
+    custom_lang = call.model_copy(deep=True)
+    custom_lang.initiate.lang.availables.append(
+        LanguageEntryModel(
+            pronunciations_en=["German", "DE", "Germany"],
+            short_code="de-DE",
+            voice="de-DE-KatjaNeural",
+        )
+    )
+    lang_description = _speech_lang_description(custom_lang)
+    assume(lang_description != initial_description)
+    assume("de-DE (German)" in lang_description)
+
+    # Language without pronunciation
+    no_pronunciation = call.model_copy(deep=True)
+    no_pronunciation.initiate.lang.availables.append(
+        LanguageEntryModel(
+            pronunciations_en=[],
+            short_code="it-IT",
+            voice="it-IT-ElsaNeural",
+        )
+    )
+    no_pronunciation_description = _speech_lang_description(no_pronunciation)
+    assume("it-IT" in no_pronunciation_description)
+    assume(no_pronunciation_description != initial_description)
+
+
+@pytest.mark.parametrize(
+    "initial_speed, speed, expected_speed, is_spoken",
+    [
+        pytest.param(1.0, 1.0, 1.0, False, id="unchanged"),
+        pytest.param(0.75, 0.6, 0.75, False, id="clamped_unchanged"),
+        pytest.param(1.0, 1.2, 1.2, True, id="changed"),
+        pytest.param(1.0, 2.0, 1.25, True, id="clamped_changed"),
+    ],
+)
+@pytest.mark.asyncio(scope="session")
+async def test_speech_speed(
+    call: CallStateModel,
+    initial_speed: float,
+    speed: float,
+    expected_speed: float,
+    is_spoken: bool,
+) -> None:
+    """
+    Test the confirmation is only spoken when the clamped speed changes.
+
+    Steps:
+    1. Set the initial speed
+    2. Request a new speed
+    3. Check the speed is clamped
+    4. Check the confirmation is spoken only if the speed changed
+    """
+    spoken: list[str] = []
+
+    async def _post_callback(_: CallStateModel) -> None:
+        pass
+
+    async def _tts_callback(text: str, _: MessageStyleEnum) -> None:
+        spoken.append(text)
+
+    call.initiate.prosody_rate = initial_speed
+    plugins = LlmPlugins(
+        call=call,
+        client=CallAutomationClientMock(
+            hang_up_callback=lambda: None,
+            play_media_callback=lambda _: None,
+            transfer_callback=lambda: None,
+        ),
+        post_callback=_post_callback,
+        tts_callback=_tts_callback,
+    )
+
+    res = await plugins.speech_speed(
+        customer_response="My voice is now different.",
+        speed=speed,
+    )
+
+    assume(call.initiate.prosody_rate == expected_speed)
+    assume(spoken == (["My voice is now different."] if is_spoken else []))
+    assume(("already set" not in res) == is_spoken)
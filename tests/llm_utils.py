@@ -0,0 +1,154 @@
+from typing import Annotated, Literal
+
+import pytest
+from pydantic import ValidationError
+from pytest import assume  # pylint: disable=no-name-in-module # pyright: ignore
+
+from helpers.llm_utils import _function_template, function_schema, validate_arguments
+
+
+class _Plugins:
+    async def notify(
+        self,
+        queries: Annotated[
+            list[str],
+            "The text queries.",
+        ],
+        speed: Annotated[
+            float,
+            "The new speed of the voice.",
+        ],
+        service: Annotated[
+            Literal["police", "firefighters"],
+            "The emergency service to notify.",
+        ] = "police",
+    ) -> str:
+        return f"Notifying {service} for {queries} at {speed}"
+
+    async def search(
+        self,
+        query: Annotated[
+            str,
+            "The query about {{ label }}.",
+        ],
+    ) -> str:
+        """
+        Search in the {{ label }} documents.
+        """
+        return f"Searching {query}"
+
+
+def test_function_schema_context() -> None:
+    """
+    Test descriptions are rendered with each context, without altering the cached templates.
+
+    Steps:
+    1. Render the same function with two contexts
+    2. Check the descriptions are different
+    3. Check the cached parameters schema is not changed
+    """
+    _, parameters_tpl, _ = _function_template(_Plugins.search)
+    initial_schema = dict(parameters_tpl["query"][0])
+
+    insurance = function_schema(_Plugins.search, label="insurance")
+    bank = function_schema(_Plugins.search, label="bank")
+
+    insurance_function = insurance["function"]
+    bank_function = bank["function"]
+    assume(
+        insurance_function.get("description", "").strip()
+        == "Search in the insurance documents."
+    )
+    assume(
+        bank_function.get("description", "").strip()
+        == "Search in the bank documents."
+    )
+    assume(
+        insurance_function["parameters"]["properties"]["query"]["description"]  # pyright: ignore
+        == "The query about insurance."
+    )
+    assume(
+        bank_function["parameters"]["properties"]["query"]["description"]  # pyright: ignore
+        == "The query about bank."
+    )
+
+    # Rendering does not leak into the cached schema
+    assume(_function_template(_Plugins.search)[1]["query"][0] == initial_schema)
+    assume("description" not in initial_schema)
+
+
+def test_function_schema_required() -> None:
+    """
+    Test required parameters are sorted and exclude the ones with a default value.
+    """
+    schema = function_schema(_Plugins.notify)
+
+    parameters = schema["function"].get("parameters", {})
+    assume(parameters.get("required") == ["queries", "speed"])
+    assume("service" in parameters.get("properties", {}))  # pyright: ignore
+
+
+def test_validate_arguments_coercion() -> None:
+    """
+    Test arguments are coerced to the annotated types and defaults are filled.
+
+    Steps:
+    1. Validate arguments as an LLM would send them
+    2. Check types are coerced
+    3. Check the default value is set
+    """
+    args = validate_arguments(
+        _Plugins.notify,
+        {
+            "queries": ["How to declare a stolen watch?"],
+            "speed": "1.1",
+        },
+    )
+
+    assume(args["queries"] == ["How to declare a stolen watch?"])
+    assume(args["speed"] == 1.1)
+    assume(isinstance(args["speed"], float))
+    assume(args["service"] == "police")
+
+
+def test_validate_arguments_missing() -> None:
+    """
+    Test a missing required argument is rejected.
+    """
+    with pytest.raises(ValidationError):
+        validate_arguments(
+            _Plugins.notify,
+            {
+                "queries": ["How to declare a stolen watch?"],
+            },
+        )
+
+
+def test_validate_arguments_extra() -> None:
+    """
+    Test an unknown argument is rejected, like the function call would do.
+    """
+    with pytest.raises(ValidationError):
+        validate_arguments(
+            _Plugins.notify,
+            {
+                "queries": ["How to declare a stolen watch?"],
+                "speed": 1.0,
+                "unknown": "value",
+            },
+        )
+
+
+def test_validate_arguments_invalid() -> None:
+    """
+    Test a value outside of the annotated type is rejected.
+    """
+    with pytest.raises(ValidationError):
+        validate_arguments(
+            _Plugins.notify,
+            {
+                "queries": ["How to declare a stolen watch?"],
+                "service": "pizzeria",
+                "speed": 1.0,
+            },
+        )
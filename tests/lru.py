@@ -0,0 +1,34 @@
+from pytest import assume  # pylint: disable=no-name-in-module # pyright: ignore
+
+from helpers.lru import LruCache
+
+
+def test_lru_eviction() -> None:
+    """
+    Test the least recently used item is evicted, and only when a new key is added.
+
+    Steps:
+    1. Fill the cache, then use the first item
+    2. Set an existing key, as concurrent misses would do
+    3. Check no item is evicted
+    4. Add a new key
+    5. Check the least recently used item is evicted
+    """
+    cache: LruCache[str, int] = LruCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assume(cache.get("a") == 1)
+
+    # Existing key is replaced in place
+    cache.set("b", 3)
+    assume(len(cache) == 2)
+    assume(cache.get("a") == 1)
+    assume(cache.get("b") == 3)
+
+    # New key evicts the least recently used
+    assume(cache.get("a") == 1)
+    cache.set("c", 4)
+    assume(len(cache) == 2)
+    assume(cache.get("a") == 1)
+    assume(cache.get("b") is None)
+    assume(cache.get("c") == 4)